@@ -12,10 +12,10 @@ Author: AI Assistant
 """
 
 import curses
+import os
 import random
-import time
+from array import array
 from enum import Enum
-from collections import deque
 
 
 class Direction(Enum):
@@ -25,10 +25,47 @@ class Direction(Enum):
     RIGHT = (0, 1)
 
 
+# Direction the snake may not turn to from each direction
+OPPOSITE = {
+    Direction.UP: Direction.DOWN,
+    Direction.DOWN: Direction.UP,
+    Direction.LEFT: Direction.RIGHT,
+    Direction.RIGHT: Direction.LEFT
+}
+
+# Movement keys: arrow keys and WASD
+KEY_DIRECTIONS = {
+    curses.KEY_UP: Direction.UP,
+    curses.KEY_DOWN: Direction.DOWN,
+    curses.KEY_LEFT: Direction.LEFT,
+    curses.KEY_RIGHT: Direction.RIGHT,
+    ord('w'): Direction.UP,
+    ord('W'): Direction.UP,
+    ord('s'): Direction.DOWN,
+    ord('S'): Direction.DOWN,
+    ord('a'): Direction.LEFT,
+    ord('A'): Direction.LEFT,
+    ord('d'): Direction.RIGHT,
+    ord('D'): Direction.RIGHT
+}
+
+
+def step(head, dir_row, dir_col, height, width, occupied):
+    """Advance the head one cell; return the new head and whether it collided."""
+    row = head[0] + dir_row
+    col = head[1] + dir_col
+    
+    # Wall collision, then self collision against the occupancy bitmap
+    collided = (row < 0 or row >= height or col < 0 or col >= width or
+                occupied[row * width + col])
+    return (row, col), collided
+
+
 class SnakeGame:
     def __init__(self, stdscr):
         self.stdscr = stdscr
         self.setup_screen()
+        self.show_splash()
         self.reset_game()
         
     def setup_screen(self):
@@ -39,9 +76,11 @@ class SnakeGame:
         # Enable keypad mode for arrow keys
         self.stdscr.keypad(True)
         
-        # Set non-blocking input with timeout
-        self.stdscr.timeout(100)  # 100ms timeout
-        
+        # Sync curses.LINES/COLS with the terminal; the game itself
+        # sizes everything from getmaxyx() below
+        if hasattr(curses, 'update_lines_cols'):
+            curses.update_lines_cols()
+            
         # Get screen dimensions
         self.height, self.width = self.stdscr.getmaxyx()
         
@@ -59,25 +98,79 @@ class SnakeGame:
             curses.init_pair(3, curses.COLOR_YELLOW, curses.COLOR_BLACK) # Score
             curses.init_pair(4, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Border
             
+        # Cache color attributes; they are constant once the pairs exist
+        has_colors = curses.has_colors()
+        self._c_snake = curses.color_pair(1) if has_colors else 0
+        self._c_food = curses.color_pair(2) if has_colors else 0
+        self._c_score = curses.color_pair(3) if has_colors else 0
+        self._c_border = curses.color_pair(4) if has_colors else 0
+        
+        # Precompute border rows so each is drawn with a single addstr
+        self._top_border = '+' + '-' * (self.width - 2) + '+'
+        self._middle_border = '|' + ' ' * (self.width - 2) + '|'
+        
+        # Drawable area; writing the bottom-right cell makes curses raise
+        self._max_row = self.height - 1
+        self._max_col = self.width - 1
+        
+        # Static controls hint, right-aligned on the bottom row if it fits
+        self._controls = "Controls: Arrow keys/WASD=Move, P=Pause, Q=Quit"
+        if len(self._controls) < self.width - 4:
+            self._controls_col = self.width - len(self._controls) - 2
+        else:
+            self._controls_col = None
+            
+    def show_splash(self):
+        """Show the start screen and wait for a key press."""
+        lines = [
+            "Starting Snake Game...",
+            "Use arrow keys or WASD to move, P to pause, Q to quit.",
+            "Press any key to start...",
+        ]
+        top = (self.height - len(lines)) // 2
+        for i, line in enumerate(lines):
+            line = line[:self.width - 1]  # Clip on narrow terminals
+            self.stdscr.addstr(top + i, (self.width - len(line)) // 2, line)
+        self.present()
+        
+        # Block until a key is pressed; reset_game sets the game tick
+        self.stdscr.timeout(-1)
+        self.stdscr.getch()
+        
     def reset_game(self):
         """Reset the game to initial state."""
         # Snake starts in the middle of the screen
         start_row = self.game_height // 2
         start_col = self.game_width // 2
         
-        # Snake body (head first)
-        self.snake = deque([
-            (start_row, start_col),
-            (start_row, start_col - 1),
-            (start_row, start_col - 2)
-        ])
+        # Snake body as a ring buffer of rows and cols, head first.
+        # head/tail index the first and last segment; the buffer can
+        # hold every cell of the game area so it never needs to grow.
+        capacity = self.game_height * self.game_width
+        self.rows = array('h', [0]) * capacity
+        self.cols = array('h', [0]) * capacity
+        for i in range(3):
+            self.rows[i] = start_row
+            self.cols[i] = start_col - i
+        self.head = 0
+        self.tail = 2
+        self.length = 3
+        
+        # Occupancy bitmap, one byte per game cell (row * game_width + col)
+        self.occ = bytearray(capacity)
+        for i in range(3):
+            self.occ[start_row * self.game_width + start_col - i] = 1
         
         # Initial direction
-        self.direction = Direction.RIGHT
+        self.set_direction(Direction.RIGHT)
         
         # Score
         self.score = 0
         
+        # Non-blocking input, timing out once per game tick
+        self.tick_ms = None
+        self.update_tick()
+        
         # Game state
         self.game_over = False
         self.paused = False
@@ -85,231 +178,289 @@ class SnakeGame:
         # Generate first food
         self.generate_food()
         
+        # Cells changed by the last update, consumed by draw_delta
+        self.last_move = None
+        
+        # UI is redrawn only when the score or game state changes
+        self._ui_dirty = True
+        self._ui_state = None
+        
+        # Draw the static parts of the screen once
+        self.draw_game()
+        
     def generate_food(self):
         """Generate food at a random location not occupied by snake."""
-        while True:
-            food_row = random.randint(0, self.game_height - 1)
-            food_col = random.randint(0, self.game_width - 1)
+        free_cells = self.game_height * self.game_width - self.length
+        if free_cells == 0:
+            # Snake fills the board, nowhere left to put food
+            self.food = None
+            return
             
-            if (food_row, food_col) not in self.snake:
-                self.food = (food_row, food_col)
+        # Pick the k-th free cell by walking the occupancy bitmap one run
+        # of free cells at a time; find() does the scanning in C
+        remaining = random.randrange(free_cells)
+        occ = self.occ
+        start = 0
+        while True:
+            end = occ.find(1, start)
+            if end == -1:
+                end = len(occ)
+            if remaining < end - start:
+                index = start + remaining
                 break
+            remaining -= end - start
+            start = occ.find(0, end)
+            
+        self.food = divmod(index, self.game_width)
                 
     def handle_input(self):
-        """Handle user input."""
+        """Handle user input, draining every key queued since the last tick."""
         try:
-            key = self.stdscr.getch()
+            key = self.stdscr.getch()  # Waits up to one tick
         except:
             return
             
         if key == -1:  # No input
             return
             
-        # Quit game
-        if key in [ord('q'), ord('Q')]:
-            self.game_over = True
-            return
-            
-        # Pause/unpause
-        if key in [ord('p'), ord('P')]:
-            self.paused = not self.paused
-            return
-            
-        if self.paused:
-            return
-            
-        # Movement controls
+        # Read the rest of the queue without waiting
+        self.stdscr.timeout(0)
         new_direction = None
-        
-        # Arrow keys
-        if key == curses.KEY_UP:
-            new_direction = Direction.UP
-        elif key == curses.KEY_DOWN:
-            new_direction = Direction.DOWN
-        elif key == curses.KEY_LEFT:
-            new_direction = Direction.LEFT
-        elif key == curses.KEY_RIGHT:
-            new_direction = Direction.RIGHT
-            
-        # WASD keys
-        elif key in [ord('w'), ord('W')]:
-            new_direction = Direction.UP
-        elif key in [ord('s'), ord('S')]:
-            new_direction = Direction.DOWN
-        elif key in [ord('a'), ord('A')]:
-            new_direction = Direction.LEFT
-        elif key in [ord('d'), ord('D')]:
-            new_direction = Direction.RIGHT
+        while key != -1:
+            # Quit game
+            if key in [ord('q'), ord('Q')]:
+                self.game_over = True
+                return
+                
+            # Pause/unpause
+            if key in [ord('p'), ord('P')]:
+                self.paused = not self.paused
+                self.draw_game()
+                break
+                
+            if self.paused:
+                break
+                
+            # Keep the last direction that doesn't reverse into the snake
+            direction = KEY_DIRECTIONS.get(key)
+            if direction and self.is_valid_direction(direction):
+                new_direction = direction
+                
+            key = self.stdscr.getch()
             
-        # Prevent snake from going backwards into itself
-        if new_direction and self.is_valid_direction(new_direction):
-            self.direction = new_direction
+        # Sleep on input while paused instead of waking every tick
+        self.stdscr.timeout(-1 if self.paused else self.tick_ms)
+        
+        if new_direction:
+            self.set_direction(new_direction)
             
     def is_valid_direction(self, new_direction):
         """Check if the new direction is valid (not opposite to current)."""
-        current = self.direction
-        
-        # Can't go in opposite direction
-        opposite_directions = {
-            Direction.UP: Direction.DOWN,
-            Direction.DOWN: Direction.UP,
-            Direction.LEFT: Direction.RIGHT,
-            Direction.RIGHT: Direction.LEFT
-        }
-        
-        return new_direction != opposite_directions[current]
-        
+        return new_direction is not OPPOSITE[self.direction]
+        
+    def set_direction(self, direction):
+        """Change direction, caching its row/col deltas for update_game."""
+        self.direction = direction
+        self._dir_r, self._dir_c = direction.value
+        
+    def update_tick(self):
+        """Shorten the tick as the score grows, updating curses only on change."""
+        tick_ms = max(40, 100 - self.score // 5)
+        if tick_ms != self.tick_ms:
+            self.tick_ms = tick_ms
+            self.stdscr.timeout(tick_ms)
+            
     def update_game(self):
         """Update game state."""
         if self.game_over or self.paused:
             return
             
-        # Calculate new head position
-        head_row, head_col = self.snake[0]
-        dir_row, dir_col = self.direction.value
-        new_head = (head_row + dir_row, head_col + dir_col)
-        
-        # Check collisions
-        if self.check_collision(new_head):
+        # Calculate new head position and check collisions
+        old_head = (self.rows[self.head], self.cols[self.head])
+        new_head, collided = step(old_head, self._dir_r, self._dir_c,
+                                  self.game_height, self.game_width, self.occ)
+        if collided:
             self.game_over = True
             return
             
         # Add new head
-        self.snake.appendleft(new_head)
+        capacity = len(self.rows)
+        self.head = (self.head - 1) % capacity
+        self.rows[self.head], self.cols[self.head] = new_head
+        self.length += 1
+        self.occ[new_head[0] * self.game_width + new_head[1]] = 1
         
         # Check if food was eaten
-        if new_head == self.food:
+        ate_food = new_head == self.food
+        if ate_food:
             self.score += 10
+            self._ui_dirty = True
             self.generate_food()
+            self.update_tick()
+            old_tail = None
         else:
             # Remove tail if no food eaten
-            self.snake.pop()
+            old_tail = (self.rows[self.tail], self.cols[self.tail])
+            self.tail = (self.tail - 1) % capacity
+            self.length -= 1
+            self.occ[old_tail[0] * self.game_width + old_tail[1]] = 0
             
-    def check_collision(self, position):
-        """Check if position collides with walls or snake body."""
-        row, col = position
-        
-        # Wall collision
-        if (row < 0 or row >= self.game_height or 
-            col < 0 or col >= self.game_width):
-            return True
+        self.last_move = (old_head, new_head, old_tail, ate_food)
             
-        # Self collision
-        if position in self.snake:
-            return True
-            
-        return False
-        
     def draw_game(self):
         """Draw the game on screen."""
-        self.stdscr.clear()
-        
         # Draw border
         self.draw_border()
         
-        # Draw snake
-        self.draw_snake()
-        
-        # Draw food
-        self.draw_food()
+        # Draw snake and food
+        self.draw_field()
         
-        # Draw UI
+        # Draw UI (the field repaint wiped any message on row 1)
+        self._ui_dirty = True
         self.draw_ui()
         
         # Refresh screen
-        self.stdscr.refresh()
+        self.present()
+        
+    def draw_delta(self):
+        """Redraw only the cells changed by the last update."""
+        if self.last_move is None:
+            return
+            
+        old_head, new_head, old_tail, ate_food = self.last_move
+        self.last_move = None
+        
+        snake_color = self._c_snake
         
+        # Erase the vacated tail before drawing the head over the body
+        if old_tail is not None:
+            self.draw_cell(old_tail, ' ', 0)
+        self.draw_cell(old_head, '#', snake_color)
+        self.draw_cell(new_head, '@', snake_color)
+        
+        # Food only changes when food is eaten
+        if ate_food:
+            self.draw_food()
+        self.draw_ui()
+            
+        self.present()
+        
+    def present(self):
+        """Flush all pending drawing to the terminal in a single update."""
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+        
+    def draw_cell(self, position, char, color):
+        """Draw a single character at a game-area position."""
+        screen_row = position[0] + self.start_row
+        screen_col = position[1] + self.start_col
+        if screen_row < self._max_row and screen_col < self._max_col:
+            self.stdscr.addch(screen_row, screen_col, char, color)
+            
     def draw_border(self):
         """Draw game border."""
-        color = curses.color_pair(4) if curses.has_colors() else 0
+        color = self._c_border
         
         # Top and bottom borders
-        for col in range(self.width):
-            self.stdscr.addch(0, col, '-', color)
-            self.stdscr.addch(self.height - 2, col, '-', color)
-            
-        # Left and right borders
-        for row in range(self.height - 1):
-            self.stdscr.addch(row, 0, '|', color)
-            self.stdscr.addch(row, self.width - 1, '|', color)
+        self.stdscr.addstr(0, 0, self._top_border, color)
+        self.stdscr.addstr(self.height - 2, 0, self._top_border, color)
+        
+    def draw_field(self):
+        """Draw the bordered game area from an in-memory framebuffer.
+        
+        Snake and food are stamped into a copy of the empty rows, then
+        each row is written with one addstr per run of same-colored cells.
+        """
+        width = self.width
+        field_rows = self.height - 3  # screen rows 1 .. height - 3
+        fb = bytearray(self._middle_border, 'ascii') * field_rows
+        colors = {}  # framebuffer offset -> color of stamped cells
+        
+        # Stamp the snake
+        snake_color = self._c_snake
+        capacity = len(self.rows)
+        for i in range(self.length):
+            index = (self.head + i) % capacity
+            offset = ((self.rows[index] + self.start_row - 1) * width +
+                      self.cols[index] + self.start_col)
+            fb[offset] = ord('@') if i == 0 else ord('#')
+            colors[offset] = snake_color
             
-        # Corners
-        self.stdscr.addch(0, 0, '+', color)
-        self.stdscr.addch(0, self.width - 1, '+', color)
-        self.stdscr.addch(self.height - 2, 0, '+', color)
-        self.stdscr.addch(self.height - 2, self.width - 1, '+', color)
-        
-    def draw_snake(self):
-        """Draw the snake."""
-        color = curses.color_pair(1) if curses.has_colors() else 0
-        
-        for i, (row, col) in enumerate(self.snake):
-            screen_row = row + self.start_row
-            screen_col = col + self.start_col
+        # Stamp the food
+        if self.food is not None:
+            food_row, food_col = self.food
+            offset = (food_row + self.start_row - 1) * width + food_col + self.start_col
+            fb[offset] = ord('*')
+            colors[offset] = self._c_food
             
-            if i == 0:  # Head
-                char = '@'
-            else:  # Body
-                char = '#'
-                
-            try:
-                self.stdscr.addch(screen_row, screen_col, char, color)
-            except curses.error:
-                pass  # Ignore if we can't draw at edge
+        # Emit each row as runs, splitting only where stamped colors begin/end
+        border_color = self._c_border
+        stamped = sorted(colors.items())
+        k = 0
+        for row in range(field_rows):
+            row_start = pos = row * width
+            row_end = row_start + width
+            while k < len(stamped) and stamped[k][0] < row_end:
+                offset, color = stamped[k]
+                end = offset + 1
+                k += 1
+                while k < len(stamped) and stamped[k] == (end, color):
+                    end += 1
+                    k += 1
+                if offset > pos:
+                    self.stdscr.addstr(row + 1, pos - row_start,
+                                       fb[pos:offset].decode('ascii'), border_color)
+                self.stdscr.addstr(row + 1, offset - row_start,
+                                   fb[offset:end].decode('ascii'), color)
+                pos = end
+            self.stdscr.addstr(row + 1, pos - row_start,
+                               fb[pos:row_end].decode('ascii'), border_color)
                 
     def draw_food(self):
         """Draw the food."""
-        color = curses.color_pair(2) if curses.has_colors() else 0
-        
-        food_row, food_col = self.food
-        screen_row = food_row + self.start_row
-        screen_col = food_col + self.start_col
-        
-        try:
-            self.stdscr.addch(screen_row, screen_col, '*', color)
-        except curses.error:
-            pass
+        if self.food is not None:
+            self.draw_cell(self.food, '*', self._c_food)
             
     def draw_ui(self):
-        """Draw user interface elements."""
-        color = curses.color_pair(3) if curses.has_colors() else 0
+        """Draw user interface elements if anything they show has changed."""
+        state = (self.paused, self.game_over)
+        if not self._ui_dirty and state == self._ui_state:
+            return
+        self._ui_dirty = False
+        self._ui_state = state
+        
+        color = self._c_score
         
         # Score
-        score_text = f"Score: {self.score}"
-        self.stdscr.addstr(self.height - 1, 2, score_text, color)
+        self.stdscr.addstr(self.height - 1, 2, f"Score: {self.score}", color)
         
         # Controls
-        controls = "Controls: Arrow keys/WASD=Move, P=Pause, Q=Quit"
-        if len(controls) < self.width - 4:
-            self.stdscr.addstr(self.height - 1, self.width - len(controls) - 2, controls)
+        if self._controls_col is not None:
+            self.stdscr.addstr(self.height - 1, self._controls_col, self._controls)
         
         # Game state messages
         if self.paused:
-            msg = "PAUSED - Press P to continue"
+            msg = "PAUSED - Press P to continue"[:self.width - 2]
             start_col = (self.width - len(msg)) // 2
             self.stdscr.addstr(1, start_col, msg, curses.A_BLINK)
             
         if self.game_over:
-            msg = f"GAME OVER! Final Score: {self.score} - Press Q to quit"
+            msg = f"GAME OVER! Final Score: {self.score} - Press Q to quit"[:self.width - 2]
             start_col = (self.width - len(msg)) // 2
-            try:
-                self.stdscr.addstr(1, start_col, msg, curses.A_BLINK | color)
-            except curses.error:
-                pass
+            self.stdscr.addstr(1, start_col, msg, curses.A_BLINK | color)
                 
     def run(self):
         """Main game loop."""
         while not self.game_over:
             self.handle_input()
             self.update_game()
-            self.draw_game()
+            self.draw_delta()
             
-        # Game over screen
-        while True:
-            key = self.stdscr.getch()
-            if key in [ord('q'), ord('Q')]:
-                break
-            self.draw_game()
+        # Game over screen: draw once, then block until Q
+        self.stdscr.timeout(-1)
+        self.draw_game()
+        while self.stdscr.getch() not in [ord('q'), ord('Q')]:
+            pass
 
 
 def main(stdscr):
@@ -323,7 +474,6 @@ def main(stdscr):
 
 if __name__ == "__main__":
     # Check terminal size
-    import os
     try:
         size = os.get_terminal_size()
         if size.columns < 40 or size.lines < 10:
@@ -332,10 +482,8 @@ if __name__ == "__main__":
     except:
         pass  # Can't check size, proceed anyway
         
-    print("Starting Snake Game...")
-    print("Use arrow keys or WASD to move, P to pause, Q to quit.")
-    print("Press any key to start...")
-    input()
+    # Plain ASCII line drawing avoids multibyte ACS sequences on UTF-8 terminals
+    os.environ.setdefault('NCURSES_NO_UTF8_ACS', '1')
     
     # Start the game
     curses.wrapper(main)